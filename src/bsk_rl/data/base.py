@@ -138,6 +138,7 @@ class GlobalReward(ABC):
         """Refresh data and cumulative reward for a new episode prior to simulator construction."""
         self.data = self.data_type()
         self.cum_reward = {}
+        self._store_updates = {}
 
     def create_data_store(self, satellite: "Satellite") -> None:
         """Create a data store for a satellite.
@@ -150,6 +151,16 @@ class GlobalReward(ABC):
             initial_data=self.scenario.initial_data(satellite, self.data_type),
         )
         self.cum_reward[satellite.id] = 0.0
+        self._store_updates[satellite.id] = satellite.data_store.update_from_logs
+
+    def update_data_stores(self) -> dict[str, Data]:
+        """Update every data store created this episode from the simulation logs.
+
+        Returns:
+            A dictionary of new data generated by each satellite during the previous
+            step, keyed by satellite ID.
+        """
+        return {sat_id: update() for sat_id, update in self._store_updates.items()}
 
     @abstractmethod  # pragma: no cover
     def calculate_reward(self, new_data_dict: dict[str, Data]) -> dict[str, float]:
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import operator
 import os
 from copy import deepcopy
 from time import time_ns
@@ -27,6 +28,8 @@ SatAct = TypeVar("SatAct")
 MultiSatObs = tuple[SatObs, ...]
 MultiSatAct = Iterable[SatAct]
 
+_getobs = operator.methodcaller("get_obs")
+
 
 class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
 
@@ -237,7 +240,7 @@ class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
 
         for satellite in self.satellites:
             satellite.reset_post_sim_init()
-            satellite.data_store.update_from_logs()
+        self.rewarder.update_data_stores()
 
         observation = self._get_obs()
         info = self._get_info()
@@ -262,7 +265,7 @@ class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
         Returns:
             tuple: Joint observation
         """
-        return tuple(satellite.get_obs() for satellite in self.satellites)
+        return tuple(map(_getobs, self.satellites))
 
     def _get_info(self) -> dict[str, Any]:
         """Compose satellite info into a single info dict.
@@ -306,27 +309,43 @@ class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
     def action_space(self) -> spaces.Space[MultiSatAct]:
         """Compose satellite action spaces into a tuple.
 
+        The joint space is composed on first access and reused afterwards.
+
         Returns:
             Joint action space
         """
-        return spaces.Tuple((satellite.action_space for satellite in self.satellites))
+        return self._joint_action_space
+
+    @functools.cached_property
+    def _joint_action_space(self) -> spaces.Tuple:
+        return spaces.Tuple(
+            tuple(map(operator.attrgetter("action_space"), self.satellites))
+        )
 
     @property
     def observation_space(self) -> spaces.Space[MultiSatObs]:
         """Compose satellite observation spaces into a tuple.
 
         Note: calls ``reset()``, which can be expensive, to determine observation size.
+        The joint space is composed once a simulator exists and reused afterwards, even
+        if the simulator is later deleted.
 
         Returns:
             Joint observation space
         """
+        if "_joint_observation_space" in self.__dict__:
+            return self._joint_observation_space
         try:
             self.simulator
         except AttributeError:
             logger.info("Calling env.reset() to get observation space")
             self.reset(seed=self.seed)
+        return self._joint_observation_space
+
+    @functools.cached_property
+    def _joint_observation_space(self) -> spaces.Tuple:
         return spaces.Tuple(
-            [satellite.observation_space for satellite in self.satellites]
+            tuple(map(operator.attrgetter("observation_space"), self.satellites))
         )
 
     def _step(self, actions: MultiSatAct) -> None:
@@ -349,10 +368,7 @@ class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
         self.simulator.run()
         self.latest_step_duration = self.simulator.sim_time - previous_time
 
-        new_data = {
-            satellite.id: satellite.data_store.update_from_logs()
-            for satellite in self.satellites
-        }
+        new_data = self.rewarder.update_data_stores()
         self.reward_dict = self.rewarder.reward(new_data)
 
         self.communicator.communicate()
@@ -393,8 +409,7 @@ class GeneralSatelliteTasking(Env, Generic[SatObs, SatAct]):
 
     def close(self) -> None:
         """Try to cleanly delete everything."""
-        if self.simulator is not None:
-            del self.simulator
+        self.delete_simulator()
 
 
 class SatelliteTasking(GeneralSatelliteTasking, Generic[SatObs, SatAct]):
@@ -419,13 +434,12 @@ class SatelliteTasking(GeneralSatelliteTasking, Generic[SatObs, SatAct]):
     @property
     def action_space(self) -> spaces.Space[SatAct]:
         """Return the single satellite action space."""
-        return self.satellite.action_space
+        return super().action_space[0]
 
     @property
     def observation_space(self) -> spaces.Box:
         """Return the single satellite observation space."""
-        super().observation_space
-        return self.satellite.observation_space
+        return super().observation_space[0]
 
     @property
     def satellite(self) -> Satellite:
@@ -17,6 +17,26 @@ from scipy.interpolate import interp1d
 bskPath = __path__[0]
 
 
+def _orbit_elements(
+    alt: float,
+    r_body: float,
+    e: float,
+    i: float,
+    Omega: float,
+    omega: float,
+    f: float,
+) -> ClassicElements:
+    """Create orbit elements from an altitude and angles in radians."""
+    oe = ClassicElements()
+    oe.a = (r_body + alt) * 1e3
+    oe.e = e
+    oe.i = i
+    oe.Omega = Omega
+    oe.omega = omega
+    oe.f = f
+    return oe
+
+
 def random_orbit(
     i: Optional[float] = 45.0,
     alt: float = 500,
@@ -43,18 +63,57 @@ def random_orbit(
     Returns:
         ClassicElements: orbital elements
     """
-    oe = ClassicElements()
-    oe.a = (r_body + alt) * 1e3
-    oe.e = e
-    oe.i = np.radians(i) if i is not None else np.random.uniform(-np.pi, np.pi)
-    oe.Omega = (
-        np.radians(Omega) if Omega is not None else np.random.uniform(0, 2 * np.pi)
+    return _orbit_elements(
+        alt,
+        r_body,
+        e,
+        np.radians(i) if i is not None else np.random.uniform(-np.pi, np.pi),
+        np.radians(Omega) if Omega is not None else np.random.uniform(0, 2 * np.pi),
+        np.radians(omega) if omega is not None else np.random.uniform(0, 2 * np.pi),
+        np.radians(f) if f is not None else np.random.uniform(0, 2 * np.pi),
     )
-    oe.omega = (
-        np.radians(omega) if omega is not None else np.random.uniform(0, 2 * np.pi)
+
+
+def random_orbits(
+    n: int,
+    seed: Optional[int] = None,
+    i: Optional[float] = 45.0,
+    alt: float = 500,
+    r_body: float = 6371,
+    e: float = 0,
+    Omega: Optional[float] = None,
+    omega: Optional[float] = 0,
+    f: Optional[float] = None,
+) -> list[ClassicElements]:
+    """Create a batch of orbit elements from a single seeded draw.
+
+    Equivalent to calling :func:`random_orbit` ``n`` times, but all randomized angles
+    are sampled at once from a local generator instead of the global ``np.random``
+    state, so the batch is reproducible from ``seed`` alone.
+
+    Args:
+        n: Number of orbits to generate.
+        seed: Seed for the random number generator.
+        i: [deg] Inclination, randomized in ``[-pi, pi]``.
+        alt: [km] Altitude above r_body.
+        r_body: [km] Body radius.
+        e: Eccentricity.
+        Omega: [deg] LAN, randomized in ``[0, 2pi]``.
+        omega: [deg] Argument of periapsis, randomized in ``[0, 2pi]``.
+        f: [deg] True anomaly, randomized in ``[0, 2pi]``.
+
+    Returns:
+        list: List of orbital elements
+    """
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(
+        [-np.pi, 0, 0, 0], [np.pi, 2 * np.pi, 2 * np.pi, 2 * np.pi], size=(n, 4)
     )
-    oe.f = np.radians(f) if f is not None else np.random.uniform(0, 2 * np.pi)
-    return oe
+    for col, fixed in enumerate([i, Omega, omega, f]):
+        if fixed is not None:
+            angles[:, col] = np.radians(fixed)
+
+    return [_orbit_elements(alt, r_body, e, *row) for row in angles]
 
 
 def random_epoch(start: int = 2000, end: int = 2022):
@@ -408,6 +467,7 @@ def lla2ecef(lat: float, long: float, radius: float):
 __doc_title__ = "Orbital"
 __all__ = [
     "random_orbit",
+    "random_orbits",
     "random_epoch",
     "lla2ecef",
     "elevation",
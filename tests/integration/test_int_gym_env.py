@@ -1,10 +1,13 @@
+import os
+
 import gymnasium as gym
 import numpy as np
+import pytest
 from gymnasium import spaces
 
-from bsk_rl import act, data, obs, sats
+from bsk_rl import GeneralSatelliteTasking, SatelliteTasking, act, data, obs, sats
 from bsk_rl.scene import UniformTargets
-from bsk_rl.utils.orbital import random_orbit
+from bsk_rl.utils.orbital import random_orbits
 
 
 class DoNothingSatellite(sats.ImagingSatellite):
@@ -12,97 +15,44 @@ class DoNothingSatellite(sats.ImagingSatellite):
     action_spec = [act.Drift()]
 
 
-class TestSatelliteTasking:
-    env = gym.make(
-        "SatelliteTasking-v1",
-        satellite=DoNothingSatellite(
-            "Sputnik",
-            sat_args=DoNothingSatellite.default_sat_args(oe=random_orbit),
-        ),
-        scenario=UniformTargets(n_targets=0),
-        rewarder=data.NoReward(),
-        sim_rate=1.0,
-        max_step_duration=10.0,
-        time_limit=100.0,
-        disable_env_checker=True,
-    )
-
-    def test_reset(self):
-        observation, info = self.env.reset()
-        assert (observation == np.array([0.0])).all()
+ORBITS = random_orbits(3, seed=0)
 
-    def test_action_space(self):
-        assert self.env.action_space == spaces.Discrete(1)
 
-    def test_observation_space(self):
-        assert self.env.observation_space == spaces.Box(-1e16, 1e16, (1,))
+def pack_sat_args(sat_args):
+    # Split comparable values into a numeric scalar array and a flat object array
+    scalars, arrays = [], []
+    for val in sat_args.values():
+        if isinstance(val, (np.ndarray, list, type(None))):
+            arrays.append(np.asarray(val, dtype=object).ravel())
+        elif np.issubdtype(type(val), np.integer) or np.issubdtype(type(val), float):
+            scalars.append(val)
+    return np.array(scalars, dtype=float), np.concatenate(arrays)
 
-    def test_step(self):
-        observation, reward, terminated, truncated, info = self.env.step(0)
-        assert (observation == np.array([0.1])).all()
 
-    def test_truncate(self):
-        terminated = truncated = False
-        while not (terminated or truncated):
-            observation, reward, terminated, truncated, info = self.env.step(0)
-        assert truncated
-        assert self.env.unwrapped.simulator.sim_time == 100.0
-
-    def test_repeatable(self):
-        self.env.reset(seed=0)
-        world_args_old = self.env.unwrapped.world_args
-        sat_args_old = self.env.unwrapped.satellite.sat_args
-        self.env.reset(seed=0)
-        assert self.env.unwrapped.world_args == world_args_old
-        for val, val_old in zip(
-            self.env.unwrapped.satellite.sat_args.values(), sat_args_old.values()
-        ):
-            if (
-                isinstance(val, (np.ndarray, list, type(None)))
-                or np.issubdtype(type(val), np.integer)
-                or np.issubdtype(type(val), float)
-            ):
-                assert np.all(val == val_old)
-
-
-class TestSingleSatelliteDeath:
-    env = gym.make(
-        "SatelliteTasking-v1",
+def make_single_env():
+    return SatelliteTasking(
         satellite=DoNothingSatellite(
-            "Skydiver",
-            sat_args=DoNothingSatellite.default_sat_args(
-                rN=[0, 0, 7e6], vN=[0, 0, -100.0], oe=None
-            ),
+            "Sputnik",
+            sat_args={"oe": ORBITS[0]},
         ),
         scenario=UniformTargets(n_targets=0),
         rewarder=data.NoReward(),
         sim_rate=1.0,
-        time_limit=1000.0,
-        failure_penalty=-1000,
-        disable_env_checker=True,
+        max_step_duration=10.0,
+        time_limit=100.0,
     )
 
-    def test_fail(self):
-        observation, info = self.env.reset()
-        observation, reward, terminated, truncated, info = self.env.step(0)
-        assert terminated
-        assert reward == -1000
-
-    def test_close(self):
-        self.env.close()
-
 
-class TestGeneralSatelliteTasking:
-    env = gym.make(
-        "GeneralSatelliteTasking-v1",
+def make_general_env():
+    return GeneralSatelliteTasking(
         satellites=[
             DoNothingSatellite(
                 "Sentinel-2A",
-                sat_args=DoNothingSatellite.default_sat_args(oe=random_orbit),
+                sat_args={"oe": ORBITS[1]},
             ),
             DoNothingSatellite(
                 "Sentinel-2B",
-                sat_args=DoNothingSatellite.default_sat_args(oe=random_orbit),
+                sat_args={"oe": ORBITS[2]},
             ),
         ],
         scenario=UniformTargets(n_targets=0),
@@ -110,30 +60,158 @@ class TestGeneralSatelliteTasking:
         sim_rate=1.0,
         max_step_duration=10.0,
         time_limit=100.0,
+    )
+
+
+TASKING_CONFIGS = {
+    "SatelliteTasking": dict(
+        make_env=make_single_env,
+        action=0,
+        action_space=spaces.Discrete(1),
+        observation_space=spaces.Box(-1e16, 1e16, (1,)),
+        obs_shape=(1,),
+    ),
+    "GeneralSatelliteTasking": dict(
+        make_env=make_general_env,
+        action=[0, 0],
+        action_space=spaces.Tuple((spaces.Discrete(1), spaces.Discrete(1))),
+        observation_space=spaces.Tuple(
+            (spaces.Box(-1e16, 1e16, (1,)), spaces.Box(-1e16, 1e16, (1,)))
+        ),
+        obs_shape=(2, 1),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "env_id,env_type,sat_key",
+    [
+        ("SatelliteTasking-v1", SatelliteTasking, "satellite"),
+        ("GeneralSatelliteTasking-v1", GeneralSatelliteTasking, "satellites"),
+    ],
+)
+def test_make(env_id, env_type, sat_key):
+    env = gym.make(
+        env_id,
+        **{sat_key: DoNothingSatellite("Vostok", sat_args={})},
         disable_env_checker=True,
     )
+    assert isinstance(env.unwrapped, env_type)
+    env.close()
 
-    def test_reset(self):
-        observation, info = self.env.reset()
-        assert (observation == np.array([0.0])).all()
 
-    def test_action_space(self):
-        assert self.env.action_space == spaces.Tuple(
-            (spaces.Discrete(1), spaces.Discrete(1))
-        )
+class TestTasking:
+    @pytest.fixture(
+        scope="class",
+        params=list(TASKING_CONFIGS.values()),
+        ids=list(TASKING_CONFIGS.keys()),
+    )
+    def tasking(self, request):
+        env = request.param["make_env"]()
+        yield env, request.param
+        env.close()
+
+    def test_reset(self, tasking):
+        env, cfg = tasking
+        observation, info = env.reset()
+        np.testing.assert_array_equal(observation, np.full(cfg["obs_shape"], 0.0))
+
+    def test_action_space(self, tasking):
+        env, cfg = tasking
+        assert env.action_space == cfg["action_space"]
+
+    def test_observation_space(self, tasking):
+        env, cfg = tasking
+        assert env.observation_space == cfg["observation_space"]
+
+    def test_step(self, tasking):
+        env, cfg = tasking
+        env.reset()
+        observation, reward, terminated, truncated, info = env.step(cfg["action"])
+        np.testing.assert_array_equal(observation, np.full(cfg["obs_shape"], 0.1))
+
+    def test_truncate(self, tasking):
+        env, cfg = tasking
+        env.reset()
+        n_steps = int(env.time_limit / env.max_step_duration)
+        for _ in range(n_steps):
+            observation, reward, terminated, truncated, info = env.step(cfg["action"])
+        assert truncated
+        assert env.simulator.sim_time == 100.0
 
-    def test_observation_space(self):
-        assert self.env.observation_space == spaces.Tuple(
-            (spaces.Box(-1e16, 1e16, (1,)), spaces.Box(-1e16, 1e16, (1,)))
+    def test_repeatable(self, tasking):
+        env, _ = tasking
+        env.reset(seed=0)
+        world_args_old = env.world_args
+        packed_old = [pack_sat_args(sat.sat_args) for sat in env.satellites]
+        env.reset(seed=0)
+        assert env.world_args == world_args_old
+        packed = [pack_sat_args(sat.sat_args) for sat in env.satellites]
+        for (scalars, arrays), (scalars_old, arrays_old) in zip(packed, packed_old):
+            np.testing.assert_array_equal(scalars, scalars_old)
+            np.testing.assert_array_equal(arrays, arrays_old)
+
+
+class TestSingleSatelliteDeath:
+    @pytest.fixture(scope="class")
+    def death_env(self):
+        env = SatelliteTasking(
+            satellite=DoNothingSatellite(
+                "Skydiver",
+                sat_args={"rN": [0, 0, 7e6], "vN": [0, 0, -100.0], "oe": None},
+            ),
+            scenario=UniformTargets(n_targets=0),
+            rewarder=data.NoReward(),
+            sim_rate=1.0,
+            time_limit=1000.0,
+            failure_penalty=-1000,
         )
+        observation, info = env.reset()
+        yield env, observation, info
+        env.close()
+
+    def test_fail(self, death_env):
+        env, observation, info = death_env
+        np.testing.assert_array_equal(observation, [0.0])
+        assert info["d_ts"] == 0.0
+        observation, reward, terminated, truncated, info = env.step(0)
+        assert terminated
+        assert reward == -1000
 
-    def test_step(self):
-        observation, reward, terminated, truncated, info = self.env.step([0, 0])
-        assert (observation == np.array([0.1])).all()
+    def test_close(self, death_env):
+        env, _, _ = death_env
+        env.close()
+        assert not hasattr(env, "simulator")
 
-    def test_truncate(self):
-        terminated = truncated = False
-        while not (terminated or truncated):
-            observation, reward, terminated, truncated, info = self.env.step([0, 0])
-        assert truncated
-        assert self.env.unwrapped.simulator.sim_time == 100.0
+
+class TestVectorEnv:
+    n_envs = 4
+
+    @pytest.fixture(
+        params=[
+            gym.vector.SyncVectorEnv,
+            pytest.param(
+                gym.vector.AsyncVectorEnv,
+                marks=pytest.mark.skipif(
+                    (os.cpu_count() or 1) < 4,
+                    reason="Process-parallel envs need at least 4 cores",
+                ),
+            ),
+        ],
+        ids=["SyncVectorEnv", "AsyncVectorEnv"],
+    )
+    def envs(self, request):
+        envs = request.param([make_general_env] * self.n_envs)
+        yield envs
+        envs.close()
+
+    def test_vectorized(self, envs):
+        observation, info = envs.reset(seed=0)
+        assert len(observation) == 2
+        for sat_obs in observation:
+            assert sat_obs.shape == (self.n_envs, 1)
+        actions = tuple(np.zeros(self.n_envs, dtype=np.int64) for _ in range(2))
+        observation, reward, terminated, truncated, info = envs.step(actions)
+        for sat_obs in observation:
+            np.testing.assert_array_equal(sat_obs, np.full((self.n_envs, 1), 0.1))
+        assert reward.shape == (self.n_envs,)
@@ -56,6 +56,22 @@ class TestGlobalReward:
         assert sat.data_store == "ds"
         assert sat.id in dm.cum_reward
 
+    def test_update_data_stores(self):
+        sats = [MagicMock() for _ in range(2)]
+        GlobalReward.datastore_type = MagicMock(
+            side_effect=lambda sat, initial_data: MagicMock(
+                update_from_logs=MagicMock(return_value=f"data_{sat.id}")
+            )
+        )
+        dm = GlobalReward()
+        dm.scenario = MagicMock()
+        dm.reset_pre_sim_init()
+        for sat in sats:
+            dm.create_data_store(sat)
+        assert dm.update_data_stores() == {sat.id: f"data_{sat.id}" for sat in sats}
+        for sat in sats:
+            sat.data_store.update_from_logs.assert_called_once()
+
     def test_reward(self):
         dm = GlobalReward()
         dm.calculate_reward = MagicMock(return_value={"sat": 10.0})
@@ -1,12 +1,33 @@
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from gymnasium import spaces
 
 from bsk_rl import ConstellationTasking, GeneralSatelliteTasking, SatelliteTasking
+from bsk_rl.data import GlobalReward
 from bsk_rl.sats import Satellite
 
 
+@pytest.fixture(scope="module", autouse=True)
+def concrete_satellite():
+    with patch.multiple(Satellite, __abstractmethods__=set()):
+        yield
+
+
+@pytest.fixture
+def rewarder():
+    return Mock(spec=GlobalReward)
+
+
+def fake_sat(**kwargs):
+    return SimpleNamespace(
+        set_action=lambda action: None,
+        is_alive=lambda log_failure=False: True,
+        **kwargs,
+    )
+
+
 class TypeA:
     pass
 
@@ -91,10 +112,11 @@ class TestGeneralSatelliteTasking:
         mock_data.create_data_store.assert_called_once_with(mock_sat)
         env.communicator.reset_post_sim_init.assert_called_once()
         mock_sat.reset_post_sim_init.assert_called_once()
+        mock_data.update_data_stores.assert_called_once()
 
     def test_get_obs(self):
         env = GeneralSatelliteTasking(
-            satellites=[MagicMock(get_obs=MagicMock(return_value=i)) for i in range(3)],
+            satellites=[fake_sat(get_obs=lambda i=i: i) for i in range(3)],
             world_type=MagicMock(),
             scenario=MagicMock(),
             rewarder=MagicMock(),
@@ -118,7 +140,7 @@ class TestGeneralSatelliteTasking:
     def test_action_space(self):
         env = GeneralSatelliteTasking(
             satellites=[
-                MagicMock(action_space=spaces.Discrete(i + 1)) for i in range(3)
+                fake_sat(action_space=spaces.Discrete(i + 1)) for i in range(3)
             ],
             world_type=MagicMock(),
             scenario=MagicMock(),
@@ -127,11 +149,12 @@ class TestGeneralSatelliteTasking:
         assert env.action_space == spaces.Tuple(
             (spaces.Discrete(1), spaces.Discrete(2), spaces.Discrete(3))
         )
+        assert env.action_space is env.action_space
 
     def test_obs_space_no_sim(self):
         env = GeneralSatelliteTasking(
             satellites=[
-                MagicMock(observation_space=spaces.Discrete(i + 1)) for i in range(3)
+                fake_sat(observation_space=spaces.Discrete(i + 1)) for i in range(3)
             ],
             world_type=MagicMock(),
             scenario=MagicMock(),
@@ -145,10 +168,26 @@ class TestGeneralSatelliteTasking:
         )
         env.reset.assert_called_once_with(seed=old_seed)
 
+    def test_obs_space_cached(self):
+        env = GeneralSatelliteTasking(
+            satellites=[
+                fake_sat(observation_space=spaces.Discrete(i + 1)) for i in range(3)
+            ],
+            world_type=MagicMock(),
+            scenario=MagicMock(),
+            rewarder=MagicMock(),
+        )
+        env.unwrapped.simulator = MagicMock()
+        env.reset = MagicMock()
+        obs_space = env.observation_space
+        env.delete_simulator()
+        assert env.observation_space is obs_space
+        env.reset.assert_not_called()
+
     def test_obs_space_existing_sim(self):
         env = GeneralSatelliteTasking(
             satellites=[
-                MagicMock(observation_space=spaces.Discrete(i + 1)) for i in range(3)
+                fake_sat(observation_space=spaces.Discrete(i + 1)) for i in range(3)
             ],
             world_type=MagicMock(),
             scenario=MagicMock(),
@@ -159,17 +198,17 @@ class TestGeneralSatelliteTasking:
         assert env.observation_space == spaces.Tuple(
             (spaces.Discrete(1), spaces.Discrete(2), spaces.Discrete(3))
         )
+        assert env.observation_space is env.observation_space
         env.reset.assert_not_called()
 
-    def test_step(self):
+    def test_step(self, rewarder):
         mock_sats = [MagicMock() for _ in range(2)]
+        rewarder.reward.return_value = {sat.id: 12.5 for sat in mock_sats}
         env = GeneralSatelliteTasking(
             satellites=mock_sats,
             world_type=MagicMock(),
             scenario=MagicMock(),
-            rewarder=MagicMock(
-                reward=MagicMock(return_value={sat.id: 12.5 for sat in mock_sats})
-            ),
+            rewarder=rewarder,
         )
         env.unwrapped.simulator = MagicMock(sim_time=101.0)
         _, reward, _, _, info = env.step((0, 10))
@@ -177,17 +216,16 @@ class TestGeneralSatelliteTasking:
         mock_sats[1].set_action.assert_called_once_with(10)
         env.unwrapped.simulator.run.assert_called_once()
         assert env.latest_step_duration == 0.0
-        for sat in mock_sats:
-            sat.data_store.update_from_logs.assert_called_once()
+        env.rewarder.update_data_stores.assert_called_once()
         assert reward == 25.0
 
-    def test_step_bad_action(self):
-        mock_sats = [MagicMock() for _ in range(2)]
+    def test_step_bad_action(self, rewarder):
+        mock_sats = [fake_sat() for _ in range(2)]
         env = GeneralSatelliteTasking(
             satellites=mock_sats,
             world_type=MagicMock(),
             scenario=MagicMock(),
-            rewarder=MagicMock(reward=MagicMock(return_value=25.0)),
+            rewarder=rewarder,
         )
         env.unwrapped.simulator = MagicMock(sim_time=101.0)
         with pytest.raises(ValueError):
@@ -198,15 +236,14 @@ class TestGeneralSatelliteTasking:
     @pytest.mark.parametrize("sat_death", [True, False])
     @pytest.mark.parametrize("timeout", [True, False])
     @pytest.mark.parametrize("terminate_on_time_limit", [True, False])
-    def test_step_stopped(self, sat_death, timeout, terminate_on_time_limit):
+    def test_step_stopped(self, rewarder, sat_death, timeout, terminate_on_time_limit):
         mock_sats = [MagicMock() for _ in range(2)]
+        rewarder.reward.return_value = {sat.id: 12.5 for sat in mock_sats}
         env = GeneralSatelliteTasking(
             satellites=mock_sats,
             world_type=MagicMock(),
             scenario=MagicMock(),
-            rewarder=MagicMock(
-                reward=MagicMock(return_value={sat.id: 12.5 for sat in mock_sats})
-            ),
+            rewarder=rewarder,
             terminate_on_time_limit=terminate_on_time_limit,
         )
         env.unwrapped.simulator = MagicMock(sim_time=101.0)
@@ -223,14 +260,14 @@ class TestGeneralSatelliteTasking:
         assert terminated == (sat_death or (timeout and terminate_on_time_limit))
         assert truncated == timeout
 
-    @patch.multiple(Satellite, __abstractmethods__=set())
-    def test_step_retask_needed(self, capfd):
+    def test_step_retask_needed(self, rewarder, capfd):
         mock_sat = MagicMock()
+        rewarder.reward.return_value = {mock_sat.id: 25.0}
         env = SatelliteTasking(
             satellite=[mock_sat],
             world_type=MagicMock(),
             scenario=MagicMock(),
-            rewarder=MagicMock(reward=MagicMock(return_value={mock_sat.id: 25.0})),
+            rewarder=rewarder,
         )
         env.unwrapped.simulator = MagicMock(sim_time=101.0)
         env.step(None)
@@ -255,11 +292,7 @@ class TestGeneralSatelliteTasking:
 
 
 class TestSatelliteTasking:
-    @patch.multiple(
-        Satellite,
-        __abstractmethods__=set(),
-        __init__=MagicMock(return_value=None),
-    )
+    @patch.object(Satellite, "__init__", MagicMock(return_value=None))
     def test_init(self):
         mock_sat = Satellite("sat", {})
         env = SatelliteTasking(
@@ -281,7 +314,9 @@ class TestSatelliteTasking:
 
     @staticmethod
     def make_env():
-        mock_sat = MagicMock()
+        mock_sat = MagicMock(
+            action_space=spaces.Discrete(2), observation_space=spaces.Discrete(3)
+        )
         env = SatelliteTasking(
             satellite=[mock_sat],
             world_type=MagicMock(),
@@ -294,12 +329,21 @@ class TestSatelliteTasking:
         env, mock_sat = self.make_env()
         assert env.action_space == mock_sat.action_space
 
-    @patch("bsk_rl.GeneralSatelliteTasking.observation_space")
-    def test_observation_space(self, obs_patch):
+    def test_observation_space(self):
         env, mock_sat = self.make_env()
         env.unwrapped.simulator = MagicMock()
         assert env.observation_space == mock_sat.observation_space
 
+    def test_obs_space_cached(self):
+        env, mock_sat = self.make_env()
+        env.unwrapped.simulator = MagicMock()
+        env.reset = MagicMock()
+        obs_space = env.observation_space
+        env.delete_simulator()
+        mock_sat.observation_space = None
+        assert env.observation_space is obs_space
+        env.reset.assert_not_called()
+
     @patch("bsk_rl.GeneralSatelliteTasking.step")
     def test_step(self, step_patch):
         env, mock_sat = self.make_env()
@@ -393,7 +437,8 @@ class TestConstellationTasking:
     def test_action_spaces(self):
         env = ConstellationTasking(
             satellites=[
-                MagicMock(action_space=spaces.Discrete(i + 1)) for i in range(3)
+                fake_sat(id=f"sat_{i}", action_space=spaces.Discrete(i + 1))
+                for i in range(3)
             ],
             world_type=MagicMock(),
             scenario=MagicMock(),
@@ -408,7 +453,8 @@ class TestConstellationTasking:
     def test_obs_spaces(self):
         env = ConstellationTasking(
             satellites=[
-                MagicMock(observation_space=spaces.Discrete(i + 1)) for i in range(3)
+                fake_sat(id=f"sat_{i}", observation_space=spaces.Discrete(i + 1))
+                for i in range(3)
             ],
             world_type=MagicMock(),
             scenario=MagicMock(),
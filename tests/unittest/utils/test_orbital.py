@@ -31,6 +31,31 @@ class TestRandomOrbit:
         assert np.pi / 2 == oe.i == oe.Omega == oe.omega == oe.f
 
 
+class TestRandomOrbits:
+    def test_random_orbits(self):
+        oes = orbital.random_orbits(10, i=None, Omega=None, omega=None, f=None)
+        assert len(oes) == 10
+        for oe in oes:
+            assert -np.pi <= oe.i <= np.pi
+            assert 0 <= oe.Omega <= 2 * np.pi
+            assert 0 <= oe.omega <= 2 * np.pi
+            assert 0 <= oe.f <= 2 * np.pi
+
+    def test_repeatable(self):
+        oes1 = orbital.random_orbits(3, seed=0)
+        oes2 = orbital.random_orbits(3, seed=0)
+        assert [oe.f for oe in oes1] == [oe.f for oe in oes2]
+        assert oes1[0].f != oes1[1].f
+
+    def test_units(self):
+        (oe,) = orbital.random_orbits(
+            1, i=90.0, alt=500, r_body=1000, e=0.1, Omega=90.0, omega=90.0, f=90.0
+        )
+        assert oe.a == 1500000
+        assert oe.e == 0.1
+        assert np.pi / 2 == oe.i == oe.Omega == oe.omega == oe.f
+
+
 class TestRandomEpoch:
     @pytest.mark.repeat(10)
     def test_random_epoch(self):